@@ -2,8 +2,8 @@
 
 """This script converts the curation sheets to BEL."""
 
-import os
 import sys
+from pathlib import Path
 
 import click
 
@@ -25,13 +25,13 @@ AUTHORS = [
 AUTHOR_STRING = ', '.join(sorted(AUTHORS, key=lambda s: s.split()[-1]))
 
 # Folder pointers
-HERE = os.path.abspath(os.path.dirname(__file__))
+HERE = Path(__file__).resolve().parent
 
-ROUNDS_DIRECTORY = os.path.abspath(os.path.join(HERE, 'rounds'))
-assert os.path.exists(ROUNDS_DIRECTORY)
+ROUNDS_DIRECTORY = HERE / 'rounds'
+assert ROUNDS_DIRECTORY.exists()
 
-DATA_DIRECTORY = os.path.abspath(os.path.join(HERE, 'data'))
-os.makedirs(DATA_DIRECTORY, exist_ok=True)
+DATA_DIRECTORY = HERE / 'data'
+DATA_DIRECTORY.mkdir(exist_ok=True)
 
 graph_metadata = dict(
     name='HBP - INDRA Curation',
@@ -41,8 +41,8 @@ graph_metadata = dict(
 )
 
 sheets_repository = BELSheetsRepository(
-    directory=ROUNDS_DIRECTORY,
-    output_directory=DATA_DIRECTORY,
+    directory=str(ROUNDS_DIRECTORY),
+    output_directory=str(DATA_DIRECTORY),
     metadata=graph_metadata,
 )
 